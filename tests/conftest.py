@@ -3,6 +3,8 @@ import pytest
 import os
 import shutil
 
+import numpy as np
+
 from titan.parse_params import create_params
 from titan.population import Population
 from titan.model import TITAN
@@ -15,8 +17,11 @@ class FakeRandom:
         self.num = num
         self.fake_choice = fake_choice
 
-    def random(self):
-        return self.num
+    def random(self, size=None):
+        if size is None:
+            return self.num
+        else:
+            return np.full(size, self.num)
 
     def randrange(self, start, stop, step=1):
         return start
@@ -27,7 +32,10 @@ class FakeRandom:
     def choice(self, seq):
         return seq[0]
 
-    def choices(self, seq, weights=None, k=1):
+    def choices(self, seq, weights=None, cum_weights=None, k=1):
+        if cum_weights is not None:
+            weights = [w - prev for w, prev in zip(cum_weights, [0, *cum_weights])]
+
         if weights is None:
             return [seq[self.fake_choice]]
         else:
@@ -43,6 +51,9 @@ class FakeRandom:
     def poisson(self, var: float, size: int = 1):
         return int(round(var))
 
+    def binomial(self, n: int, p: float):
+        return n if self.num < p else 0
+
 
 # test fixtures used throughout unit tests
 @pytest.fixture
@@ -69,6 +69,7 @@ def test_hiv_convert(make_model, make_agent):
     model = make_model()
     a = make_agent()
     a.prep.active = True
+    num_race_hiv = HIV.race_counts[a.race]
 
     model.run_random = FakeRandom(-0.1)
 
@@ -77,8 +78,13 @@ def test_hiv_convert(make_model, make_agent):
     assert a.hiv.active
     assert a.hiv.time == model.time
     assert a in HIV.agents
+    assert HIV.race_counts[a.race] == num_race_hiv + 1
     assert a.prep.active is False
 
+    # converting again doesn't double count
+    a.hiv.convert(model)
+    assert HIV.race_counts[a.race] == num_race_hiv + 1
+
 
 @pytest.mark.unit
 def test_diagnose_hiv(make_model, make_agent):
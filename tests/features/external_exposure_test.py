@@ -1,6 +1,6 @@
 import pytest
 
-from conftest import FakeRandom
+from titan.features import ExternalExposure
 
 
 @pytest.mark.unit
@@ -10,10 +10,20 @@ def test_external_exposure(make_model, make_agent, params):
     model = make_model(params)
     external_exposure_agent = make_agent()
     external_exposure_agent.external_exposure.active = True
+    external_exposure_agent.location.params.external_exposure.convert_prob = 1.0
     model.pop.add_agent(external_exposure_agent)
-    model.run_random = FakeRandom(-0.1)
+    ExternalExposure.add_agent(external_exposure_agent)
 
     assert external_exposure_agent.hiv.active is False
 
+    # the draw happens for the population, conversion waits for the agent update
+    ExternalExposure.update_pop(model)
+    assert external_exposure_agent in ExternalExposure.converts
+    assert external_exposure_agent.hiv.active is False
+
     external_exposure_agent.external_exposure.update_agent(model)
     assert external_exposure_agent.hiv.active
+
+    # removed agents are no longer exposed
+    model.pop.remove_agent(external_exposure_agent)
+    assert external_exposure_agent not in ExternalExposure.agents
@@ -10,7 +10,7 @@ from conftest import FakeRandom
 @pytest.mark.unit
 def test_injection_transmission(make_model, make_agent):
     model = make_model()
-    model.np_random = FakeRandom(1.0)
+    model.np_random = FakeRandom(-0.1)
     model.run_random = FakeRandom(-0.1)
     model.time = model.params.hiv.start_time + 2
     a = make_agent(race="black", DU="Inj", SO="HM")
@@ -32,7 +32,7 @@ def test_injection_transmission(make_model, make_agent):
 @pytest.mark.unit
 def test_injection_num_acts(make_model, make_agent):
     model = make_model()
-    model.np_random = FakeRandom(0.5)
+    model.np_random = FakeRandom(0.0)
     a = make_agent()
     p = make_agent()
     a.drug_type = "Inj"
@@ -66,9 +66,25 @@ def test_injection_get_num_acts_do_nothing(make_model, make_agent):
     p_inj = make_agent(race="white", DU="Inj", SO="HF")
     rel_Inj = Relationship(a, p_inj, 10, bond_type="Inj")
 
-    model.run_random = FakeRandom(-0.1)
+    model.np_random = FakeRandom(-0.1)
 
     assert Injection.get_num_acts(model, rel_Inj) > 0
 
-    model.run_random = FakeRandom(1.1)
+    model.np_random = FakeRandom(1.1)
     assert Injection.get_num_acts(model, rel_Inj) == 0
+
+
+@pytest.mark.unit
+def test_injection_num_acts_scaled_prob(make_model, make_agent):
+    model = make_model()
+    a = make_agent(race="white", DU="Inj", SO="HM")
+    p = make_agent(race="white", DU="Inj", SO="HF")
+    rel = Relationship(a, p, 10, bond_type="Inj")
+
+    # location scaling can push the probability above 1
+    a.location.params.demographics[a.race].sex_type[a.sex_type].injection.num_acts = 10
+    a.location.params.demographics[a.race].sex_type[
+        a.sex_type
+    ].injection.unsafe_prob = 2.0
+
+    assert Injection.get_num_acts(model, rel) > 0
@@ -67,13 +67,26 @@ def test_sex_num_acts(make_model, make_agent, make_relationship, params):
     params.hiv.dx.risk_reduction.sex = 1.0
     model = make_model()
     model.time = model.params.hiv.start_time
-    model.np_random = FakeRandom(1.0)
+    model.np_random = FakeRandom(0.0)
     a = make_agent()
     p = make_agent()
     a.partners["Sex"] = set()
     p.partners["Sex"] = set()
     rel_Sex = Relationship(a, p, 10, bond_type="Sex")
 
+    a.location.params.partnership.sex.frequency = (
+        p.location.params.partnership.sex.frequency
+    ) = ObjMap(
+        {
+            "Sex": {
+                "type": "distribution",
+                "distribution": {
+                    "dist_type": "set_value",
+                    "vars": {1: {"value": 10, "value_type": "int"}},
+                },
+            }
+        }
+    )
     assert Sex.get_num_acts(model, rel_Sex) > 0
 
     a.hiv.active = True
@@ -96,3 +109,32 @@ def test_sex_num_acts(make_model, make_agent, make_relationship, params):
         }
     )
     assert Sex.get_num_acts(model, rel_Sex) == 0
+
+
+@pytest.mark.unit
+def test_sex_num_acts_scaled_prob(make_model, make_agent):
+    model = make_model()
+    model.time = model.params.hiv.start_time
+    a = make_agent()
+    p = make_agent()
+    a.partners["Sex"] = set()
+    p.partners["Sex"] = set()
+    rel_Sex = Relationship(a, p, 10, bond_type="Sex")
+
+    a.location.params.partnership.sex.frequency = (
+        p.location.params.partnership.sex.frequency
+    ) = ObjMap(
+        {
+            "Sex": {
+                "type": "distribution",
+                "distribution": {
+                    "dist_type": "set_value",
+                    "vars": {1: {"value": 10, "value_type": "int"}},
+                },
+            }
+        }
+    )
+
+    # location scaling can push the probability above 1
+    a.location.params.demographics[a.race].sex_type[a.sex_type].safe_sex.Sex.prob = 2.0
+    assert Sex.get_num_acts(model, rel_Sex) == 0
@@ -26,6 +26,23 @@ def test_location_init(params):
     assert "values" in world.pop_weights["black"]
     assert "weights" in world.pop_weights["white"]
 
+    assert (
+        world.sex_type_params["white", "WSW"]
+        is world.params.demographics.white.sex_type.WSW
+    )
+    assert (
+        world.drug_type_params["white", "WSW", "NonInj"]
+        is world.params.demographics.white.sex_type.WSW.drug_type.NonInj
+    )
+    white_age = world.params.demographics.white.age
+    assert world.age_bins["white"][0] == (
+        1,
+        white_age[1].prob,
+        white_age[1].min,
+        white_age[1].max,
+    )
+    assert len(world.age_bins["white"]) == len(white_age)
+
     assert len(world.neighbors) == 0
 
 
@@ -28,6 +28,12 @@ def test_model_init(params):
     assert model.run_seed > 0
     assert model.pop.pop_seed > 0
 
+    # only overridden updates are dispatched to
+    update_names = [name for name, _ in model.agent_updates]
+    assert "hiv" in update_names
+    assert "syringe_services" not in update_names
+    assert HighRisk.update_pop not in model.pop_updates
+
 
 @pytest.mark.unit
 def test_update_all_agents(make_model, make_agent):
@@ -61,7 +67,7 @@ def test_update_all_agents(make_model, make_agent):
 @pytest.mark.unit
 def test_die_and_replace_none(make_model):
     model = make_model()
-    model.run_random = FakeRandom(0.999)  # always greater than death rate
+    model.np_random = FakeRandom(0.999)  # always greater than death rate
     baseline_pop = copy(model.pop.all_agents.members)
 
     model.die_and_replace()
@@ -75,7 +81,7 @@ def test_die_and_replace_none(make_model):
 def test_die_and_replace_all(make_model, params):
     params.features.incar = False
     model = make_model(params)
-    model.run_random = FakeRandom(0.0000001)  # always lower than death rate
+    model.np_random = FakeRandom(0.0000001)  # always lower than death rate
 
     baseline_pop = copy(model.pop.all_agents.members)
     old_ids = [a.id for a in baseline_pop]
@@ -112,7 +118,7 @@ def test_die_and_replace_all(make_model, params):
 @pytest.mark.unit
 def test_die_and_replace_incar(make_model):
     model = make_model()
-    model.run_random = FakeRandom(0.0000001)  # always lower than death rate
+    model.np_random = FakeRandom(0.0000001)  # always lower than death rate
     baseline_pop = copy(model.pop.all_agents.members)
     old_ids = [a.id for a in baseline_pop]
 
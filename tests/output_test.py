@@ -135,6 +135,15 @@ def test_write_graph_edgelist(setup_results_dir, make_population):
 
     assert count == len(pop.relationships)
 
+    # edges without a bond type are written without the type field
+    graph = nx.Graph()
+    graph.add_edge("a", "b", type="Sex")
+    graph.add_edge("b", "c")
+    write_graph_edgelist(graph, path, id, t + 1)
+
+    file_path = os.path.join(path, f"{id}_Edgelist_t{t + 1}.txt")
+    assert open(file_path).read() == "a|b|Sex\nb|c\n"
+
 
 @pytest.mark.unit
 def test_write_network_stats(setup_results_dir, make_population):
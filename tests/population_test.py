@@ -86,26 +86,59 @@ def test_create_agent_proportions(make_population, params):
 @pytest.mark.unit
 def test_add_remove_agent_to_pop(make_population):
     pop = make_population(n=100)
+    # initial agents are added to the graph in bulk
+    assert set(pop.graph.nodes()) == pop.all_agents.members
+
+    agent = pop.create_agent(pop.geography.locations["world"], "white", 0, "HM")
+    pop.add_agent(agent, add_to_graph=False)
+    assert agent in pop.all_agents.members
+    assert not pop.graph.has_node(agent)
+
     agent = pop.create_agent(pop.geography.locations["world"], "white", 0, "HM")
     agent.drug_type = "Inj"
     agent.hiv.active = True
     agent.hiv.aids = True
     agent.hiv.dx = True
     agent.hiv.add_agent(agent)
+    num_white = pop.race_counts["white"]
 
     pop.add_agent(agent)
 
     assert agent in pop.all_agents.members
+    assert pop.race_counts["white"] == num_white + 1
+    for sex_type in pop.params.classes.sex_types["HM"].sleeps_with:
+        assert agent in pop.sex_partners[sex_type]
 
     assert pop.graph.has_node(agent)
 
     pop.remove_agent(agent)
 
     assert agent not in pop.all_agents.members
+    assert pop.race_counts["white"] == num_white
+    assert all(agent not in agents for agents in pop.sex_partners.values())
 
     assert not pop.graph.has_node(agent)
 
 
+@pytest.mark.unit
+def test_remove_agent_ends_relationships(make_population, make_relationship):
+    pop = make_population(n=0)
+    a = pop.create_agent(pop.geography.locations["world"], "white", 0, "MSM")
+    b = pop.create_agent(pop.geography.locations["world"], "white", 0, "MSM")
+    pop.add_agent(a)
+    pop.add_agent(b)
+    rel = make_relationship(a, b)
+    pop.add_relationship(rel)
+
+    pop.remove_agent(a)
+
+    assert rel not in pop.relationships
+    assert rel not in b.relationships
+    assert a not in b.get_partners()
+    assert not pop.graph.has_node(a)
+    assert pop.graph.has_node(b)
+
+
 @pytest.mark.unit
 def test_get_age(make_population, params):
     pop = make_population(n=100)
@@ -129,7 +162,7 @@ def test_update_agent_partners_one_agent(make_population, params):
     agent = next(iter(pop.all_agents))  # the only agent in the pop
 
     for bond in params.classes.bond_types:
-        pop.update_agent_partners(agent, bond, [])  # noMatch == True
+        pop.update_agent_partners(agent, bond, {})  # noMatch == True
     assert agent in pop.graph.nodes()
     assert len(pop.graph.edges()) == 0
 
@@ -153,7 +186,7 @@ def test_update_agent_partners_PWID_no_match(make_population, params):
     assert p.drug_type == "None"
 
     for bond in params.classes.bond_types.keys():
-        assert pop.update_agent_partners(a, bond, [])
+        assert pop.update_agent_partners(a, bond, {})
         assert a in pop.graph.nodes()
         assert p in pop.graph.nodes()
         assert not a.partners[bond]
@@ -162,7 +195,7 @@ def test_update_agent_partners_PWID_no_match(make_population, params):
     p.sex_type = "MSM"
     p.drug_type = "None"
     for bond in params.classes.bond_types.keys():
-        assert pop.update_agent_partners(a, bond, [])
+        assert pop.update_agent_partners(a, bond, {})
         assert a in pop.graph.nodes()
         assert p in pop.graph.nodes()
         assert not a.partners[bond]
@@ -180,7 +213,7 @@ def test_update_agent_partners_MSM_no_match(make_population, params):
     pop.add_agent(a)
     pop.add_agent(p)
 
-    assert pop.update_agent_partners(a, "Sex", [])
+    assert pop.update_agent_partners(a, "Sex", {})
     assert a in pop.graph.nodes()
     assert p in pop.graph.nodes()
     assert not a.partners["Sex"]
@@ -212,7 +245,7 @@ def test_update_agent_partners_PWID_match(make_population, params):
     pop.add_agent(p)
     assert pop.partnerable_agents["Inj"]
 
-    no_match = pop.update_agent_partners(a, "Inj", [])
+    no_match = pop.update_agent_partners(a, "Inj", {})
     assert no_match is False
     assert a in pop.graph.nodes()
     assert p in pop.graph.nodes()
@@ -234,7 +267,7 @@ def test_update_agent_partners_MSM_match(make_population, params):
     pop.add_agent(a)
     pop.add_agent(p)
 
-    no_match = pop.update_agent_partners(a, "Sex", [])
+    no_match = pop.update_agent_partners(a, "Sex", {})
     assert no_match is False
     assert a in pop.graph.nodes()
     assert p in pop.graph.nodes()
@@ -258,7 +291,7 @@ def test_update_agent_partners_NDU_PWID_match(make_population, params):
     pop.add_agent(a)
     pop.add_agent(p)
 
-    no_match = pop.update_agent_partners(a, "Sex", [])
+    no_match = pop.update_agent_partners(a, "Sex", {})
     assert no_match is False
     assert a in pop.graph.nodes()
     assert p in pop.graph.nodes()
@@ -301,6 +334,27 @@ def test_update_partner_assignments_MSM_match(make_population, params):
     assert len(pop.graph.edges()) == 1
 
 
+@pytest.mark.unit
+def test_update_partner_assignments_batch_edges(make_population, params):
+    pop = make_population(n=0)
+    a = pop.create_agent(pop.geography.locations["world"], "white", 0, "MSM")
+    p = pop.create_agent(pop.geography.locations["world"], "white", 0, "MSM")
+    # ensure random sex partner no assorting
+    pop.pop_random = FakeRandom(1.1)
+    a.drug_type = "None"
+    p.drug_type = "None"
+
+    pop.add_agent(a)
+    pop.add_agent(p)
+    a.target_partners["Sex"] = 100
+    p.target_partners["Sex"] = 100
+
+    pop.update_partner_assignments(1, batch_edges=True)
+    assert pop.pending_edges is None
+    assert pop.graph.has_edge(a, p)
+    assert pop.graph.edges[a, p]["type"] == "Sex"
+
+
 @pytest.mark.unit
 def test_update_partner_assignments_PWID_match(make_population, params):
     pop = make_population(n=0)
@@ -23,12 +23,34 @@ def test_check_rand_int():
         utils.get_check_rand_int(3.3)
 
 
+@pytest.mark.unit
+def test_memo():
+    calls = []
+
+    @utils.memo
+    def double(x):
+        calls.append(x)
+        return x * 2
+
+    assert double(2) == 4
+    assert double(2) == 4
+    assert double(3) == 6
+    assert calls == [2, 3]
+
+
 @pytest.mark.unit
 def test_safe_divide():
     assert utils.safe_divide(1, 0) == 0.0
     assert utils.safe_divide(1, 2) == 0.5
 
 
+@pytest.mark.unit
+def test_total_probability():
+    assert utils.total_probability(0.5, 0) == 0.0
+    assert utils.total_probability(0.5, 1) == 0.5
+    assert utils.total_probability(0.5, 2) == 1.0 - utils.binom_0(2, 0.5)
+
+
 @pytest.mark.unit
 def test_safe_random_choice():
     rand_gen = random.Random(123)
@@ -38,6 +60,7 @@ def test_safe_random_choice():
     assert utils.safe_random_choice([1, 2, 3], rand_gen) == 1
 
     assert utils.safe_random_choice([1, 2, 3], rand_gen, [1000, 1, 1]) == 1
+    assert utils.safe_random_choice([1, 2, 3], rand_gen, cum_weights=[0, 0, 1]) == 3
 
 
 @pytest.mark.unit
@@ -47,6 +70,7 @@ def test_safe_shuffle():
 
     assert utils.safe_shuffle({1, 2, 3}, rand_gen) != [1, 2, 3]
     assert utils.safe_shuffle([1, 2, 3], rand_gen) != [1, 2, 3]
+    assert sorted(utils.safe_shuffle(frozenset({1, 2, 3}), rand_gen)) == [1, 2, 3]
 
 
 @pytest.mark.unit
@@ -425,8 +425,7 @@ class AgentSet:
         args:
             agent: agent to remove
         """
-        if agent in self.members:
-            self.members.remove(agent)
+        self.members.discard(agent)
 
         for subset in self.iter_subset():
             subset.remove_agent(agent)
@@ -27,6 +27,9 @@ class HIV(base_exposure.BaseExposure):
     agents: Set["agent.Agent"] = set()
     """Agents with active hiv"""
 
+    race_counts: Dict[str, int] = {}
+    """Counts of agents with active hiv by race"""
+
     def __init__(self, agent: "agent.Agent"):
         super().__init__(agent)
 
@@ -39,7 +42,7 @@ class HIV(base_exposure.BaseExposure):
     @classmethod
     def init_class(cls, params):
         """
-        Initialize any diagnosis counts and the agents set.
+        Initialize any diagnosis counts, race counts and the agents set.
 
         args:
             params: parameters for this population
@@ -49,6 +52,7 @@ class HIV(base_exposure.BaseExposure):
             for race in params.classes.races
         }
         cls.agents = set()
+        cls.race_counts = {race: 0 for race in params.classes.races}
 
     def init_agent(self, pop: "population.Population", time: int):
         """
@@ -60,11 +64,9 @@ class HIV(base_exposure.BaseExposure):
             pop: the population this agent is a part of
             time: the current time step
         """
-        agent_params = (
-            self.agent.location.params.demographics[self.agent.race]
-            .sex_type[self.agent.sex_type]
-            .drug_type[self.agent.drug_type]
-        )
+        agent_params = self.agent.location.drug_type_params[
+            self.agent.race, self.agent.sex_type, self.agent.drug_type
+        ]
 
         # HIV
         if (
@@ -102,12 +104,9 @@ class HIV(base_exposure.BaseExposure):
         """
         if self.active and model.time >= model.params.hiv.start_time:
             if not self.dx:
-                test_prob = (
-                    self.agent.location.params.demographics[self.agent.race]
-                    .sex_type[self.agent.sex_type]
-                    .drug_type[self.agent.drug_type]
-                    .hiv.dx.prob
-                )
+                test_prob = self.agent.location.drug_type_params[
+                    self.agent.race, self.agent.sex_type, self.agent.drug_type
+                ].hiv.dx.prob
 
                 # Rescale based on calibration param
                 test_prob *= model.calibration.test_frequency
@@ -122,12 +121,14 @@ class HIV(base_exposure.BaseExposure):
         """
         Add an agent to the class (not instance).  This can be useful if tracking population level statistics or groups, such as counts or newly active agents.
 
-        Add the agent to the `agents` set and if the agent is diagnosed, updated the `dx_counts`
+        Add the agent to the `agents` set (updating `race_counts`) and if the agent is diagnosed, updated the `dx_counts`
 
         args:
             agent: the agent to add to the class attributes
         """
-        cls.agents.add(agent)
+        if agent not in cls.agents:
+            cls.agents.add(agent)
+            cls.race_counts[agent.race] += 1
 
         if agent.hiv.dx:  # type: ignore[attr-defined]
             cls.dx_counts[agent.race][agent.sex_type] += 1
@@ -137,12 +138,13 @@ class HIV(base_exposure.BaseExposure):
         """
         Remove an agent from the class (not instance).  This can be useful if tracking population level statistics or groups, such as counts.
 
-        Remove the agent from the `agents` set and decrement the `dx_counts` if the agent was diagnosed.
+        Remove the agent from the `agents` set (updating `race_counts`) and decrement the `dx_counts` if the agent was diagnosed.
 
         args:
             agent: the agent to remove from the class attributes
         """
         cls.agents.remove(agent)
+        cls.race_counts[agent.race] -= 1
 
         if agent.hiv.dx:  # type: ignore[attr-defined]
             cls.dx_counts[agent.race][agent.sex_type] -= 1
@@ -1,3 +1,7 @@
+from typing import ClassVar, Set
+
+import numpy as np  # type: ignore
+
 from . import base_feature
 from .. import agent
 from .. import population
@@ -8,11 +12,27 @@ class ExternalExposure(base_feature.BaseFeature):
 
     name = "external_exposure"
 
+    agents: ClassVar[Set["agent.Agent"]] = set()
+    """Agents with active external exposure"""
+    converts: ClassVar[Set["agent.Agent"]] = set()
+    """Agents drawn to convert this time step"""
+
     def __init__(self, agent: "agent.Agent"):
         super().__init__(agent)
 
         self.active = False
 
+    @classmethod
+    def init_class(cls, params):
+        """
+        Initialize the set of external exposure agents.
+
+        args:
+            params: the population params
+        """
+        cls.agents = set()
+        cls.converts = set()
+
     def init_agent(self, pop: "population.Population", time: int):
         """
         Initialize the agent for this feature during population initialization (`Population.create_agent`).  Called on only features that are enabled per the params.
@@ -27,17 +47,63 @@ class ExternalExposure(base_feature.BaseFeature):
         if self.agent.sex_type == params.sex_type:
             if pop.pop_random.random() < params.init:
                 self.active = True
+                self.add_agent(self.agent)
+
+    @classmethod
+    def add_agent(cls, agent: "agent.Agent"):
+        """
+        Add an agent to the class (not instance).
+
+        Add the agent to the set of external exposure agents.
+
+        args:
+            agent: the agent to add to the class attributes
+        """
+        cls.agents.add(agent)
+
+    @classmethod
+    def remove_agent(cls, agent: "agent.Agent"):
+        """
+        Remove an agent from the class (not instance).
+
+        Remove the agent from the set of external exposure agents.
+
+        args:
+            agent: the agent to remove from the class attributes
+        """
+        cls.agents.discard(agent)
+
+    @classmethod
+    def update_pop(cls, model: "model.TITAN"):
+        """
+        Update the feature for the entire population (class method).
+
+        Draw a random number for every external exposure agent at once and, with a probability from params, mark the agent to convert.  The conversion itself happens in `update_agent` so it stays in the agent update phase.
+
+        args:
+            model: the instance of TITAN currently being run
+        """
+        if not cls.agents:
+            cls.converts = set()
+            return
+
+        agents = list(cls.agents)
+        convert_probs = np.array(
+            [a.location.params.external_exposure.convert_prob for a in agents]
+        )
+        draws = model.np_random.random(len(agents)) < convert_probs
+        cls.converts = {a for a, convert in zip(agents, draws) if convert}
 
     def update_agent(self, model: "model.TITAN"):
         """
         Update the agent for this feature for a time step.  Called once per time step in `TITAN.update_all_agents`. Agent level updates are done after population level updates.   Called on only features that are enabled per the params.
 
-        If the agent has external exposure, with a probability from params, convert the agent.
+        If the agent was marked to convert in `update_pop`, convert the agent.
 
         args:
             model: the instance of TITAN currently being run
         """
-        params = self.agent.location.params.external_exposure
-        if self.active and model.run_random.random() < params.convert_prob:
+        if self.agent in self.converts:
+            params = self.agent.location.params.external_exposure
             agent_exposure = getattr(self.agent, params.exposure)
             agent_exposure.convert(model)
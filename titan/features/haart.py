@@ -52,12 +52,9 @@ class HAART(base_feature.BaseFeature):
             pop: the population this agent is a part of
             time: the current time step
         """
-        haart_params = (
-            self.agent.location.params.demographics[self.agent.race]
-            .sex_type[self.agent.sex_type]
-            .drug_type[self.agent.drug_type]
-            .haart
-        )
+        haart_params = self.agent.location.drug_type_params[
+            self.agent.race, self.agent.sex_type, self.agent.drug_type
+        ].haart
         if (
             self.agent.hiv.dx  # type: ignore[attr-defined]
             and pop.pop_random.random() < haart_params.init
@@ -78,12 +75,9 @@ class HAART(base_feature.BaseFeature):
             and model.time >= model.params.hiv.start_time  # haart starts with hiv
         ):
             # Determine probability of HIV treatment
-            haart_params = (
-                self.agent.location.params.demographics[self.agent.race]
-                .sex_type[self.agent.sex_type]
-                .drug_type[self.agent.drug_type]
-                .haart
-            )
+            haart_params = self.agent.location.drug_type_params[
+                self.agent.race, self.agent.sex_type, self.agent.drug_type
+            ].haart
             # Go on HAART
             if not self.active:
                 self.enroll(model, haart_params)
@@ -95,18 +89,15 @@ class HAART(base_feature.BaseFeature):
                     self.active = False
                     self.adherent = False
                     self.remove_agent(self.agent)
-                # Become non-adherent
-                elif (
-                    self.adherent
-                    and model.run_random.random() < haart_params.adherence.discontinue
-                ):
-                    self.adherent = False
-                # Become adherent
-                elif (
-                    not self.adherent
-                    and model.run_random.random() < haart_params.adherence.become
-                ):
-                    self.adherent = True
+                # Become non-adherent if adherent, adherent if non-adherent
+                else:
+                    switch_prob = (
+                        haart_params.adherence.discontinue
+                        if self.adherent
+                        else haart_params.adherence.become
+                    )
+                    if model.run_random.random() < switch_prob:
+                        self.adherent = not self.adherent
 
     @classmethod
     def add_agent(cls, agent: "agent.Agent"):
@@ -3,7 +3,6 @@
 from typing import Dict, Optional
 
 from . import base_feature
-from .. import utils
 from .. import agent
 from .. import population
 from .. import model
@@ -53,9 +52,9 @@ class HighRisk(base_feature.BaseFeature):
         """
         if (
             pop.pop_random.random()
-            < self.agent.location.params.demographics[self.agent.race]
-            .sex_type[self.agent.sex_type]
-            .high_risk.init
+            < self.agent.location.sex_type_params[
+                self.agent.race, self.agent.sex_type
+            ].high_risk.init
         ):
             self.become_high_risk(pop, time)
 
@@ -91,20 +90,21 @@ class HighRisk(base_feature.BaseFeature):
         else:
             self.active = False
 
-            self.update_partner_numbers(
-                model.pop, -1 * self.agent.location.params.high_risk.partner_scale
-            )
-
-            for bond in self.agent.location.params.high_risk.partnership_types:
-                num_ended = 0
-                while (
-                    len(self.agent.partners[bond]) - num_ended
-                ) > self.agent.target_partners[bond]:
-                    rel = utils.safe_random_choice(
-                        self.agent.relationships, model.run_random
-                    )
-                    if rel is not None:
-                        num_ended += 1
+            hr_params = self.agent.location.params.high_risk
+            self.update_partner_numbers(model.pop, -1 * hr_params.partner_scale)
+
+            # end enough relationships to get back down to the target
+            for bond in hr_params.partnership_types:
+                num_to_end = (
+                    len(self.agent.partners[bond]) - self.agent.target_partners[bond]
+                )
+                if num_to_end > 0:
+                    bond_rels = [
+                        rel for rel in self.agent.relationships if rel.bond_type == bond
+                    ]
+                    for rel in model.run_random.sample(
+                        bond_rels, min(num_to_end, len(bond_rels))
+                    ):
                         rel.duration = 0  # will end on next step
 
     def set_stats(self, stats: Dict[str, int], time: int):
@@ -119,12 +119,11 @@ class HighRisk(base_feature.BaseFeature):
                     if self.agent.haart.active:  # type: ignore[attr-defined]
                         stats["high_risk_new_haart"] += 1
 
-        # newly hiv
-        if self.agent.hiv.time == time:  # type: ignore[attr-defined]
+        # newly hiv (only agents who were ever high risk are counted)
+        if self.ever and self.agent.hiv.time == time:  # type: ignore[attr-defined]
             if self.active:
                 stats["hiv_new_high_risk"] += 1
-            if self.ever:
-                stats["hiv_new_high_risk_ever"] += 1
+            stats["hiv_new_high_risk_ever"] += 1
 
     # ============== HELPER METHODS ================
 
@@ -140,7 +139,8 @@ class HighRisk(base_feature.BaseFeature):
             duration: duration of the high risk period, defaults to param value if not passed [params.high_risk.sex_based]
         """
 
-        if not self.agent.location.params.features.high_risk:
+        params = self.agent.location.params
+        if not params.features.high_risk:
             return None
 
         if not self.ever:
@@ -152,13 +152,9 @@ class HighRisk(base_feature.BaseFeature):
         if duration is not None:
             self.duration = duration
         else:
-            self.duration = self.agent.location.params.high_risk.sex_based[
-                self.agent.sex_type
-            ].duration
+            self.duration = params.high_risk.sex_based[self.agent.sex_type].duration
 
-        self.update_partner_numbers(
-            pop, self.agent.location.params.high_risk.partner_scale
-        )
+        self.update_partner_numbers(pop, params.high_risk.partner_scale)
 
     def update_partner_numbers(self, pop: "population.Population", amount: int):
         """
@@ -168,9 +164,15 @@ class HighRisk(base_feature.BaseFeature):
             pop: the model population
             amount: the positive or negatative amount to adjust the mean by
         """
-        for bond in self.agent.location.params.high_risk.partnership_types:
+        bonds = list(self.agent.location.params.high_risk.partnership_types)
+        for bond in bonds:
             self.agent.mean_num_partners[bond] += amount  # could be negative
-            self.agent.target_partners[bond] = utils.poisson(
-                self.agent.mean_num_partners[bond], pop.np_random
-            )
-            pop.update_partnerability(self.agent)
+
+        # draw all of the new targets at once
+        targets = pop.np_random.poisson(
+            [self.agent.mean_num_partners[bond] for bond in bonds]
+        )
+        for bond, target in zip(bonds, targets):
+            self.agent.target_partners[bond] = int(target)
+
+        pop.update_partnerability(self.agent)
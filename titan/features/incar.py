@@ -37,11 +37,9 @@ class Incar(base_feature.BaseFeature):
             pop: the population this agent is a part of
             time: the current time step
         """
-        incar_params = (
-            self.agent.location.params.demographics[self.agent.race]
-            .sex_type[self.agent.sex_type]
-            .incar
-        )
+        incar_params = self.agent.location.sex_type_params[
+            self.agent.race, self.agent.sex_type
+        ].incar
         jail_duration = incar_params.duration.init
 
         prob_incar = incar_params.init
@@ -70,6 +68,7 @@ class Incar(base_feature.BaseFeature):
             model: the instance of TITAN currently being run
         """
         hiv_bool = self.agent.hiv.active  # type: ignore[attr-defined]
+        rand = model.run_random.random
 
         if hiv_bool:
             hiv_multiplier = self.agent.location.params.incar.hiv.multiplier
@@ -85,26 +84,21 @@ class Incar(base_feature.BaseFeature):
                 # does agent stay on haart
                 if hiv_bool:
                     if self.agent.haart.active:  # type: ignore[attr-defined]
-                        if (
-                            model.run_random.random()
-                            <= self.agent.location.params.incar.haart.discontinue
-                        ):
+                        if rand() <= self.agent.location.params.incar.haart.discontinue:
                             self.agent.haart.active = False  # type: ignore[attr-defined]
                             self.agent.haart.adherent = False  # type: ignore[attr-defined]
 
         # should the agent become incarcerated?
-        elif model.run_random.random() < (
-            self.agent.location.params.demographics[self.agent.race]
-            .sex_type[self.agent.sex_type]
-            .incar.prob
+        elif rand() < (
+            self.agent.location.sex_type_params[
+                self.agent.race, self.agent.sex_type
+            ].incar.prob
             * hiv_multiplier
             * model.calibration.incarceration
         ):
-            incar_duration = (
-                self.agent.location.params.demographics[self.agent.race]
-                .sex_type[self.agent.sex_type]
-                .incar.duration.prob
-            )
+            incar_duration = self.agent.location.sex_type_params[
+                self.agent.race, self.agent.sex_type
+            ].incar.duration.prob
 
             bin = utils.get_cumulative_bin(model.run_random, incar_duration)
 
@@ -116,17 +110,11 @@ class Incar(base_feature.BaseFeature):
 
             if hiv_bool:
                 if not self.agent.hiv.dx:  # type: ignore[attr-defined]
-                    if (
-                        model.run_random.random()
-                        < self.agent.location.params.incar.hiv.dx
-                    ):
+                    if rand() < self.agent.location.params.incar.hiv.dx:
                         self.agent.hiv.diagnose(model)  # type: ignore[attr-defined]
                 else:  # Then tested and HIV, check to enroll in ART
-                    if (
-                        model.run_random.random()
-                        < self.agent.location.params.incar.haart.prob
-                    ):
-                        self.agent.haart.adherent = model.run_random.random() < self.agent.location.params.incar.haart.adherence  # type: ignore[attr-defined]
+                    if rand() < self.agent.location.params.incar.haart.prob:
+                        self.agent.haart.adherent = rand() < self.agent.location.params.incar.haart.adherence  # type: ignore[attr-defined]
                         # Add agent to HAART class set, update agent params
                         self.agent.haart.active = True  # type: ignore[attr-defined]
 
@@ -1,4 +1,4 @@
-from typing import Dict, ClassVar, Optional
+from typing import Dict, ClassVar, FrozenSet, Optional
 
 import numpy as np  # type: ignore
 
@@ -26,6 +26,9 @@ class Prep(base_feature.BaseFeature):
     # class level attributes to track all Prep agents
     counts: ClassVar[Dict[str, int]] = {}
 
+    # target models under which every agent is eligible
+    all_eligible_models: ClassVar[FrozenSet[str]] = frozenset({"Allcomers", "Racial"})
+
     def __init__(self, agent: "agent.Agent"):
         super().__init__(agent)
         # agent level attributes
@@ -60,9 +63,9 @@ class Prep(base_feature.BaseFeature):
             if "Racial" in params.prep.target_model:
                 if (
                     pop.pop_random.random()
-                    < params.demographics[self.agent.race]
-                    .sex_type[self.agent.sex_type]
-                    .prep.init
+                    < self.agent.location.sex_type_params[
+                        self.agent.race, self.agent.sex_type
+                    ].prep.init
                 ):
                     self.enroll(pop.pop_random, time)
             elif pop.pop_random.random() < params.prep.init:
@@ -164,39 +167,40 @@ class Prep(base_feature.BaseFeature):
         if self.active or self.agent.hiv.active:  # type: ignore[attr-defined]
             return
 
-        params = self.agent.location.params
+        prep_params = self.agent.location.params.prep
 
         if force:
             self.enroll(model.run_random, model.time)
-        elif params.prep.cap_as_prob:
-            if "Racial" in params.prep.target_model:
+        elif prep_params.cap_as_prob:
+            if "Racial" in prep_params.target_model:
                 if (
                     model.run_random.random()
-                    <= params.demographics[self.agent.race]
-                    .sex_type[self.agent.sex_type]
-                    .prep.cap
+                    <= self.agent.location.sex_type_params[
+                        self.agent.race, self.agent.sex_type
+                    ].prep.cap
                 ):
                     self.enroll(model.run_random, model.time)
             else:
-                if model.run_random.random() <= params.prep.cap:
+                if model.run_random.random() <= prep_params.cap:
                     self.enroll(model.run_random, model.time)
         else:
-            if "Racial" in params.prep.target_model:
+            if "Racial" in prep_params.target_model:
                 num_prep_agents = self.counts[self.agent.race]
-                all_hiv_agents = exposures.HIV.agents
-                all_race = {
-                    a for a in model.pop.all_agents if a.race == self.agent.race
-                }
-
-                num_hiv_agents = len(all_hiv_agents & all_race)
-                target_prep = (len(all_race) - num_hiv_agents) * params.demographics[
-                    self.agent.race
-                ].sex_type[self.agent.sex_type].prep.cap
+                num_race_agents = model.pop.race_counts[self.agent.race]
+                num_hiv_agents = (
+                    exposures.HIV.race_counts[self.agent.race]
+                    if model.params.exposures.hiv
+                    else 0
+                )
+                prep_cap = self.agent.location.sex_type_params[
+                    self.agent.race, self.agent.sex_type
+                ].prep.cap
+                target_prep = (num_race_agents - num_hiv_agents) * prep_cap
             else:
                 num_prep_agents = sum(self.counts.values())
                 target_prep = int(
                     (model.pop.all_agents.num_members() - len(exposures.HIV.agents))
-                    * params.prep.cap
+                    * prep_params.cap
                 )
 
             if num_prep_agents < target_prep:
@@ -217,9 +221,9 @@ class Prep(base_feature.BaseFeature):
 
         self.adherent = (
             rand_gen.random()
-            < params.demographics[self.agent.race]
-            .sex_type[self.agent.sex_type]
-            .prep.adherence
+            < self.agent.location.sex_type_params[
+                self.agent.race, self.agent.sex_type
+            ].prep.adherence
         )
 
         if "Inj" in params.prep.type and "Oral" in params.prep.type:
@@ -248,9 +252,9 @@ class Prep(base_feature.BaseFeature):
         if self.type == "Oral":
             if (
                 model.run_random.random()
-                < self.agent.location.params.demographics[self.agent.race]
-                .sex_type[self.agent.sex_type]
-                .prep.discontinue
+                < self.agent.location.sex_type_params[
+                    self.agent.race, self.agent.sex_type
+                ].prep.discontinue
             ):
                 self.discontinue()
             else:
@@ -287,9 +291,6 @@ class Prep(base_feature.BaseFeature):
         if self.agent.hiv.active or time < params.prep.start_time:  # type: ignore[attr-defined]
             return False
 
-        target_model = params.prep.target_model
-        gender = params.classes.sex_types[self.agent.sex_type].gender
-
         if (
             self.active
             or self.agent.vaccine.active  # type: ignore[attr-defined]
@@ -297,19 +298,22 @@ class Prep(base_feature.BaseFeature):
         ):
             return False
 
-        all_eligible_models = {"Allcomers", "Racial"}
+        target_model = params.prep.target_model
 
-        if all_eligible_models.intersection(target_model):
+        if not self.all_eligible_models.isdisjoint(target_model):
             return True
 
-        if "cdc_women" in target_model:
-            if gender == "F":
-                if self.cdc_eligible():
-                    return True
+        if "cdc_women" in target_model or "cdc_msm" in target_model:
+            gender = params.classes.sex_types[self.agent.sex_type].gender
 
-        if "cdc_msm" in target_model:
-            if gender == "M" and self.cdc_eligible():
-                return True
+            if "cdc_women" in target_model:
+                if gender == "F":
+                    if self.cdc_eligible():
+                        return True
+
+            if "cdc_msm" in target_model:
+                if gender == "M" and self.cdc_eligible():
+                    return True
 
         if "pwid_sex" in target_model:
             if self.agent.drug_type == "Inj" and self.cdc_eligible():
@@ -1,4 +1,5 @@
 import logging
+import math
 
 from . import base_feature
 from .. import model as hiv_model
@@ -64,27 +65,28 @@ class SyringeServices(base_feature.BaseFeature):
                     )
                 break
 
+        # always shuffle so the run_random stream doesn't depend on which branch runs
         target_set = utils.safe_shuffle(
             (model.pop.pwid_agents.members - ssp_agents), model.run_random
         )
 
+        # the cap and the number enrolled only change here, so work out how many
+        # agents need to change status up front instead of re-checking per agent
+        num_enrolled = len(ssp_agents)
+        target_num = math.ceil(ssp_num_slots)
+
         # unenroll agents if above cap
-        for agent in ssp_agents.copy():
-            if len(ssp_agents) > ssp_num_slots:
+        if num_enrolled > target_num:
+            for agent in list(ssp_agents)[: num_enrolled - target_num]:
                 agent.syringe_services.active = False  # type: ignore[attr-defined]
-                ssp_agents.remove(agent)
-            else:
-                break
+                num_enrolled -= 1
 
         # enroll agents if below cap
-        for agent in target_set:
-            if len(ssp_agents) < ssp_num_slots:
+        elif num_enrolled < target_num:
+            for agent in list(target_set)[: target_num - num_enrolled]:
                 agent.syringe_services.active = True  # type: ignore[attr-defined]
-                ssp_agents.add(agent)
-            else:
-                break
+                num_enrolled += 1
 
         logging.info(
-            f"SSP has {ssp_num_slots} target slots with "
-            f"{len(ssp_agents)} slots filled"
+            f"SSP has {ssp_num_slots} target slots with {num_enrolled} slots filled"
         )
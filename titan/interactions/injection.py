@@ -24,16 +24,12 @@ class Injection(base_interaction.BaseInteraction):
         assert rel.agent1.drug_type == "Inj"
         assert rel.agent2.drug_type == "Inj"
 
-        agent_params = (
-            rel.agent1.location.params.demographics[rel.agent1.race]
-            .sex_type[rel.agent1.sex_type]
-            .injection
-        )
-        partner_params = (
-            rel.agent2.location.params.demographics[rel.agent2.race]
-            .sex_type[rel.agent2.sex_type]
-            .injection
-        )
+        agent_params = rel.agent1.location.sex_type_params[
+            rel.agent1.race, rel.agent1.sex_type
+        ].injection
+        partner_params = rel.agent2.location.sex_type_params[
+            rel.agent2.race, rel.agent2.sex_type
+        ].injection
 
         mean_num_acts = (
             min(agent_params.num_acts, partner_params.num_acts)
@@ -55,8 +51,8 @@ class Injection(base_interaction.BaseInteraction):
         if rel.agent1.hiv.dx or rel.agent1.hiv.dx:  # type: ignore[attr-defined]
             p_unsafe_injection *= 1 - model.params.hiv.dx.risk_reduction.injection
 
-        for n in range(share_acts):
-            if model.run_random.random() > p_unsafe_injection:
-                share_acts -= 1
+        # location scaling can push the probability outside [0, 1]
+        p_unsafe_injection = min(max(p_unsafe_injection, 0.0), 1.0)
 
-        return share_acts
+        # each act is independently unsafe, draw the number of unsafe acts at once
+        return int(model.np_random.binomial(share_acts, p_unsafe_injection))
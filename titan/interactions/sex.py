@@ -25,8 +25,7 @@ class Sex(base_interaction.BaseInteraction):
 
         # Get condom usage
         p_safe_sex = (
-            rel.agent1.location.params.demographics[rel.agent1.race]
-            .sex_type[rel.agent1.sex_type]
+            rel.agent1.location.sex_type_params[rel.agent1.race, rel.agent1.sex_type]
             .safe_sex[rel.bond_type]
             .prob
         )
@@ -39,10 +38,11 @@ class Sex(base_interaction.BaseInteraction):
             )
             p_safe_sex = 1 - p_unsafe_sex
 
-        # Reduction of risk acts between partners for condom usage
-        unsafe_sex_acts = total_sex_acts
-        for n in range(unsafe_sex_acts):
-            if model.run_random.random() < p_safe_sex:
-                unsafe_sex_acts -= 1
+        # Reduction of risk acts between partners for condom usage (each act is
+        # independently unsafe, so draw the number of unsafe acts all at once)
+        if total_sex_acts < 1:
+            return 0
 
-        return unsafe_sex_acts
+        # location scaling can push the probability outside [0, 1]
+        p_unsafe_sex = min(max(1 - p_safe_sex, 0.0), 1.0)
+        return int(model.np_random.binomial(total_sex_acts, p_unsafe_sex))
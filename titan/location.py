@@ -1,5 +1,6 @@
-from typing import Optional, Set, Dict, List, Any
+from typing import Optional, Set, Dict, List, Any, Tuple
 from copy import deepcopy
+import itertools
 import math
 import os
 import csv
@@ -29,6 +30,12 @@ class Location:
         self.pop_weights: Dict[str, Dict[str, List[Any]]] = {}
         self.role_weights: Dict[str, Dict] = {}
         self.drug_weights: Dict[str, Dict] = {}
+
+        # demographic params by (race, sex_type) and (race, sex_type, drug_type)
+        self.sex_type_params: Dict[Tuple[str, str], ObjMap] = {}
+        self.drug_type_params: Dict[Tuple[str, str, str], ObjMap] = {}
+        # age bins by race as (bin, prob, min, max), copied at construction
+        self.age_bins: Dict[str, List[Tuple[int, float, int, int]]] = {}
         self.init_weights()
 
         self.migration_weights: Dict[str, Any] = {}
@@ -80,6 +87,8 @@ class Location:
         * drug_type
         * race
         * sex_type
+
+        Also indexes the demographic params by race, sex_type and drug_type so agent level lookups are a single dictionary access, and flattens each race's age bins.  The type params are references to the param ObjMaps, but the age bins are a construction-time snapshot (like the weights above), so later edits to `params.demographics[race].age` are not reflected in `age_bins`.
         """
 
         def init_weight_dict(d, item):
@@ -97,13 +106,19 @@ class Location:
             self.drug_weights[race] = {}
             init_weight_dict(self.pop_weights, race)
             total_ppl += race_param.ppl
+            self.age_bins[race] = [
+                (bin, fields.prob, fields.min, fields.max)
+                for bin, fields in race_param.age.items()
+            ]
             for st, st_param in race_param.sex_type.items():
+                self.sex_type_params[race, st] = st_param
                 add_weight(self.pop_weights[race], st, st_param.ppl)
                 init_weight_dict(self.role_weights[race], st)
                 init_weight_dict(self.drug_weights[race], st)
                 for role, prob in st_param.sex_role.init.items():
                     add_weight(self.role_weights[race][st], role, prob)
                 for dt, dt_param in st_param.drug_type.items():
+                    self.drug_type_params[race, st, dt] = dt_param
                     add_weight(self.drug_weights[race][st], dt, dt_param.ppl)
 
                 assert math.isclose(
@@ -197,15 +212,20 @@ class Geography:
                     assert math.isclose(
                         sum(weights), 1, abs_tol=0.001
                     ), f"Migration weights for {from_loc} must add to 1"
+                    cum_weights = list(itertools.accumulate(weights))
                     if params.location.migration.attribute == "name":
                         self.locations[from_loc].migration_weights["prob"] = prob
                         self.locations[from_loc].migration_weights["weights"] = weights
                         self.locations[from_loc].migration_weights["values"] = values
+                        self.locations[from_loc].migration_weights[
+                            "cum_weights"
+                        ] = cum_weights
                     elif params.location.migration.attribute == "category":
                         for location in self.categories[from_loc]:
                             location.migration_weights["prob"] = prob
                             location.migration_weights["weights"] = weights
                             location.migration_weights["values"] = values
+                            location.migration_weights["cum_weights"] = cum_weights
                     else:
                         raise ValueError("Unknown migration attribute")
 
@@ -73,13 +73,38 @@ class TITAN:
             for interaction in interactions.BaseInteraction.__subclasses__()
         }
 
+        # dispatch table of bond type to the interactions its relationships have
+        self.bond_interactions = {
+            bond: [self.interactions[act] for act in bond_def.acts_allowed]
+            for bond, bond_def in params.classes.bond_types.items()
+        }
+
+        # the enabled exposures/features are fixed for a run, so resolve which
+        # updates are overridden (do any work) once instead of dispatching to
+        # no-ops for every agent every step - compared against the base no-ops so
+        # hooks inherited from intermediate classes or mixins are kept
+        self.agent_updates = [
+            (exposure.name, exposure.update_agent)
+            for exposure in self.exposures
+            if exposure.update_agent is not exposures.BaseExposure.update_agent
+        ] + [
+            (feature.name, feature.update_agent)
+            for feature in self.features
+            if feature.update_agent is not features.BaseFeature.update_agent
+        ]
+        # update_pop is a classmethod, so compare the underlying functions
+        self.pop_updates = [
+            feature.update_pop
+            for feature in self.features
+            if feature.update_pop.__func__  # type: ignore[attr-defined]
+            is not features.BaseFeature.update_pop.__func__  # type: ignore[attr-defined]
+        ]
+
         # Set seed format. 0: pure random, else: fixed value
         self.run_seed = utils.get_check_rand_int(params.model.seed.run)
         logging.info(f"  Run seed was set to: {self.run_seed}")
         self.run_random = random.Random(self.run_seed)
         self.np_random = np.random.default_rng(self.run_seed)
-        random.seed(self.run_seed)
-        logging.info(("  FIRST RANDOM CALL {}".format(random.randint(0, 100))))
 
         logging.info("  Resetting death count")
         self.deaths: List["ag.Agent"] = []  # Number of death
@@ -189,7 +214,7 @@ class TITAN:
                 len(exposures.HIV.agents),
                 sum([1 for a in self.pop.all_agents if a.incar.active]),  # type: ignore[attr-defined]
                 sum([1 for a in self.pop.all_agents if a.high_risk.active]),  # type: ignore[attr-defined]
-                sum([1 for a in self.pop.all_agents if a.prep.active]),  # type: ignore[attr-defined]
+                sum(features.Prep.counts.values()) if self.params.features.prep else 0,
             )
         )
 
@@ -249,16 +274,22 @@ class TITAN:
         ):
             self.make_agent_zero()
 
+        agents_interact = self.agents_interact
         for rel in self.pop.relationships:
-            self.agents_interact(rel)
+            agents_interact(rel)
 
-        for feature in self.features:
-            feature.update_pop(self)
+        for update_pop in self.pop_updates:
+            update_pop(self)
 
+        # happy birthday agents!
+        birthday = (
+            self.time > 0 and (self.time % self.params.model.time.steps_per_year) == 0
+        )
+        update_agent = self.update_agent
         for agent in self.pop.all_agents:
-            self.update_agent(agent)
+            update_agent(agent, birthday)
 
-    def update_agent(self, agent):
+    def update_agent(self, agent: "ag.Agent", birthday: bool = False):
         """
         Update an agent at the given model timestep.
 
@@ -266,18 +297,16 @@ class TITAN:
             * age
             * all exposures
             * all features (agent level)
+
+        args:
+            agent: the agent to update
+            birthday: whether the agent ages a year this timestep
         """
-        # happy birthday agents!
-        if self.time > 0 and (self.time % self.params.model.time.steps_per_year) == 0:
+        if birthday:
             agent.age += 1
 
-        for exposure in self.exposures:
-            agent_feature = getattr(agent, exposure.name)
-            agent_feature.update_agent(self)
-
-        for feature in self.features:
-            agent_feature = getattr(agent, feature.name)
-            agent_feature.update_agent(self)
+        for name, update in self.agent_updates:
+            update(getattr(agent, name), self)
 
     def make_agent_zero(self):
         """
@@ -349,28 +378,29 @@ class TITAN:
         args:
             rel : The relationship that the agents interact in
         """
-        interaction_types = self.params.classes.bond_types[rel.bond_type].acts_allowed
         # If either agent is incarcerated, skip their interaction
         if rel.agent1.incar.active or rel.agent2.incar.active:  # type: ignore[attr-defined]
             return
 
-        for interaction_type in interaction_types:
-            interaction = self.interactions[interaction_type]
+        for interaction in self.bond_interactions[rel.bond_type]:
             interaction.interact(self, rel)
 
     def die_and_replace(self):
         """
         Let agents die and replace the dead agent with a new agent randomly.
         """
-        # die stage
-        for agent in self.pop.all_agents:
-            # agent incarcerated, don't evaluate for death
-            if agent.incar.active:
-                continue
-
-            # death rate per 1 person-month
-            p = (
-                prob.get_death_rate(
+        pop = self.pop
+        steps_per_year = self.params.model.time.steps_per_year
+        mortality = self.calibration.mortality
+        get_death_rate = prob.get_death_rate
+
+        # agent incarcerated, don't evaluate for death
+        agents = [agent for agent in pop.all_agents if not agent.incar.active]
+
+        # death rate per 1 person-month
+        death_probs = np.array(
+            [
+                get_death_rate(
                     agent.hiv.active,
                     agent.hiv.aids,
                     agent.drug_type,
@@ -378,28 +408,26 @@ class TITAN:
                     agent.haart.adherent,
                     agent.race,
                     agent.location,
-                    self.params.model.time.steps_per_year,
+                    steps_per_year,
                 )
-                * self.calibration.mortality
-            )
-
-            if self.run_random.random() < p:
-                self.deaths.append(agent)
+                for agent in agents
+            ]
+        )
 
-                # End all existing relationships
-                for rel in copy(agent.relationships):
-                    rel.progress(force=True)
-                    self.pop.remove_relationship(rel)
+        # die stage - draw for all agents at once
+        dies = self.np_random.random(len(agents)) < death_probs * mortality
+        self.deaths.extend(agent for agent, die in zip(agents, dies) if die)
 
         # replace stage
         for agent in self.deaths:
             # mark agent component as -1 (no componenet)
             agent.component = "-1"
 
-            # Remove agent from agent class and sub-sets
-            self.pop.remove_agent(agent)
+            # Remove agent from agent class and sub-sets, ending all existing
+            # relationships
+            pop.remove_agent(agent)
 
-            new_agent = self.pop.create_agent(
+            new_agent = pop.create_agent(
                 agent.location, agent.race, self.time, agent.sex_type, agent.drug_type
             )
-            self.pop.add_agent(new_agent)
+            pop.add_agent(new_agent)
@@ -3,6 +3,7 @@
 
 from typing import Dict, Any, List, Iterator
 import itertools
+from operator import attrgetter
 import os
 
 import networkx as nx  # type: ignore
@@ -32,26 +33,34 @@ def setup_aggregates(params: ObjMap, reportables, classes: List[str]) -> Dict:
     returns:
         dictionary of class values to counts
     """
-    if classes == []:
-        base_stats = {
-            "agents": 0,
-            "deaths": 0,
-            "deaths_hiv": 0,
-        }
+    stat_names = ["agents", "deaths", "deaths_hiv"]
+    for reportable in reportables:
+        stat_names.extend(reportable.stats)
 
-        for reportable in reportables:
-            base_stats.update({stat: 0 for stat in reportable.stats})
+    # every leaf is a copy of the same zeroed counts
+    return copy_aggregates(params, dict.fromkeys(stat_names, 0), classes)
 
-        return base_stats
 
-    stats = {}
-    clss, *rem_clss = classes  # head, tail
-    keys = [k for k in params.classes[clss]]
+def copy_aggregates(params: ObjMap, base_stats: Dict[str, int], classes: List[str]):
+    """
+    Recursively create a nested dictionary of attribute values to copies of `base_stats`.
 
-    for key in keys:
-        stats[key] = setup_aggregates(params, reportables, rem_clss)
+    args:
+        params: model parameters
+        base_stats: the counts at each leaf of the dictionary
+        classes: which classes to aggregate by
 
-    return stats
+    returns:
+        dictionary of class values to counts
+    """
+    if classes == []:
+        return base_stats.copy()
+
+    clss, *rem_clss = classes  # head, tail
+    return {
+        key: copy_aggregates(params, base_stats, rem_clss)
+        for key in params.classes[clss]
+    }
 
 
 def get_aggregates(params: ObjMap) -> Iterator:
@@ -69,25 +78,6 @@ def get_aggregates(params: ObjMap) -> Iterator:
     )
 
 
-def get_agg_val(stats: Dict, attrs: List, key: str) -> int:
-    """
-    Get the value of a key in stats given the attribute values
-
-    args:
-        stats: a nested dictionary of attributes to count
-        attrs: a list of attribute values to find the count for
-        key: the type of count to get the value of
-
-    returns:
-        the count of key for the given attributes
-    """
-    stats_item = stats
-    for attr in attrs:
-        stats_item = stats_item[attr]
-
-    return stats_item[key]
-
-
 def get_stats_item(stats: Dict[str, Any], attrs: List[str], agent: "ag.Agent"):
     """
     Get the leaf node of the stats dictionary for the given attributes and agent.
@@ -143,18 +133,31 @@ def get_stats(
 
     # attribute names (non-plural)
     attrs = [clss[:-1] for clss in params.outputs.classes]
+    reportable_names = [reportable.name for reportable in reportables]
+
+    # leaf nodes of stats keyed by the agent's attribute values, so the nested
+    # dictionary is only walked once per combination
+    get_attr_values = attrgetter(*attrs) if attrs else lambda a: None
+    stats_items: Dict[Any, Dict[str, int]] = {}
+
+    def get_item(a):
+        attr_values = get_attr_values(a)
+        try:
+            return stats_items[attr_values]
+        except KeyError:
+            stats_item = stats_items[attr_values] = get_stats_item(stats, attrs, a)
+            return stats_item
 
     for a in all_agents:
-        stats_item = get_stats_item(stats, attrs, a)
+        stats_item = get_item(a)
 
         add_agent_to_stats(stats_item, "agents")
 
-        for reportable in reportables:
-            agent_feature = getattr(a, reportable.name)
-            agent_feature.set_stats(stats_item, time)
+        for name in reportable_names:
+            getattr(a, name).set_stats(stats_item, time)
 
     for a in deaths:
-        stats_item = get_stats_item(stats, attrs, a)
+        stats_item = get_item(a)
         add_agent_to_stats(stats_item, "deaths")
         if a.hiv.active:  # type: ignore[attr-defined]
             add_agent_to_stats(stats_item, "deaths_hiv")
@@ -204,29 +207,32 @@ def write_report(
     stat_names = get_stat_names(stats, attrs)
 
     if f.tell() == 0:
-        f.write("run_id\trseed\tpseed\tt\t")  # start header
-
-        # attributes in stats
-        f.write("\t".join(attrs))
-
-        # report specific fields
-        for name in stat_names:
-            f.write(f"\t{name}")
-
-        f.write("\n")
+        # run info, then attributes in stats, then report specific fields
+        f.write(
+            "run_id\trseed\tpseed\tt\t"
+            + "\t".join(attrs)
+            + "".join([f"\t{name}" for name in stat_names])
+            + "\n"
+        )
 
+    # build all of the rows and write them at once
+    row_start = f"{run_id}\t{runseed}\t{popseed}\t{t}\t"
+    rows = []
     for agg in get_aggregates(params):
-        # don't write row if no agents are in it
-        if get_agg_val(stats, agg, "agents") > 0:
-            f.write(f"{run_id}\t{runseed}\t{popseed}\t{t}\t")
-
-            f.write("\t".join(agg))  # write attribute values
-
-            for name in stat_names:
-                f.write(f"\t{(get_agg_val(stats, agg, name))}")
-
-            f.write("\n")
+        stats_item = stats
+        for attr in agg:
+            stats_item = stats_item[attr]
 
+        # don't write row if no agents are in it
+        if stats_item["agents"] > 0:
+            rows.append(
+                row_start
+                + "\t".join(agg)  # attribute values
+                + "".join([f"\t{stats_item[name]}" for name in stat_names])
+                + "\n"
+            )
+
+    f.write("".join(rows))
     f.close()
 
 
@@ -256,13 +262,17 @@ def basicReport(
 
 def effective_size(comp):
     total_size = 0
-    for node in comp.nodes():
-        num_neighbors = len(comp[node])
+    for node, neighbors in comp.adjacency():
+        num_neighbors = len(neighbors)
         if num_neighbors == 0:
             continue
 
-        E = comp.subgraph(comp.neighbors(node))
-        total_size += num_neighbors - (2 * E.size()) / num_neighbors
+        # twice the number of edges among the node's neighbors, counted from the
+        # adjacency directly instead of building a subgraph view per node
+        num_ties = sum(
+            len(neighbors.keys() & comp[neighbor].keys()) for neighbor in neighbors
+        )
+        total_size += num_neighbors - num_ties / num_neighbors
 
     return total_size
 
@@ -287,15 +297,7 @@ def print_components(
         outdir: path where the file should be saved
         races: the races in the population
     """
-    f = open(os.path.join(outdir, f"{run_id}_componentReport_ALL.txt"), "a")
-
-    # if this is a new file, write the header info
-    if f.tell() == 0:
-        f.write(
-            "run_id\trunseed\tpopseed\tt\tcomponent"
-            "\tdensity\tEffectiveSize\tdeg_cent\n"
-        )
-
+    rows = []
     for (id, comp) in enumerate(components):
         num_nodes = comp.number_of_nodes()
 
@@ -304,13 +306,21 @@ def print_components(
 
         deg_cent = mean(list(nx.degree_centrality(comp).values()))
 
-        f.write(
+        rows.append(
             f"{run_id}\t{runseed}\t{popseed}\t{t}\t{id}\t"
             f"\t{comp_density:.4f}"
             f"\t{average_size:.4f}\t{deg_cent}\n"
         )
 
-    f.close()
+    with open(os.path.join(outdir, f"{run_id}_componentReport_ALL.txt"), "a") as f:
+        # if this is a new file, write the header info
+        if f.tell() == 0:
+            f.write(
+                "run_id\trunseed\tpopseed\tt\tcomponent"
+                "\tdensity\tEffectiveSize\tdeg_cent\n"
+            )
+
+        f.write("".join(rows))
 
 
 def write_graph_edgelist(graph, path: str, id, time):
@@ -323,8 +333,18 @@ def write_graph_edgelist(graph, path: str, id, time):
         time: timestep the edgelist is being written at
     """
     file_path = os.path.join(path, f"{id}_Edgelist_t{time}.txt")
-    # Write edgelist with bond type
-    nx.write_edgelist(graph, file_path, delimiter="|", data=["type"])
+    # Write edgelist with bond type, building the file contents up front so
+    # the whole edgelist goes out in one write instead of one per edge
+    # (matches nx.write_edgelist with data=["type"] - the type is left off edges without one)
+    lines = []
+    for u, v, data in graph.edges(data=True):
+        if "type" in data:
+            lines.append(f"{u}|{v}|{data['type']}\n")
+        else:
+            lines.append(f"{u}|{v}\n")
+
+    with open(file_path, "w") as f:
+        f.write("".join(lines))
 
 
 def write_network_stats(graph, path: str, id, time):
@@ -4,6 +4,7 @@
 # Imports
 from typing import Optional, Dict, Set
 from copy import copy
+from operator import attrgetter
 
 import numpy as np  # type: ignore
 
@@ -36,17 +37,23 @@ def select_partner(
     returns:
         new partner or `None`
     """
-    eligible = copy(partnerable_agents)
-    eligible -= agent.get_partners()
-    eligible -= {agent}
-
     acts_allowed = params.classes.bond_types[bond_type].acts_allowed
 
+    # intersect with the constraining sets first - intersection iterates the
+    # smaller set, so this avoids copying all partnerable agents
     if "injection" in acts_allowed:
-        eligible &= pwid_agents.members
+        eligible = partnerable_agents & pwid_agents.members
+        if "sex" in acts_allowed:
+            eligible &= sex_partners[agent.sex_type]
+    elif "sex" in acts_allowed:
+        eligible = partnerable_agents & sex_partners[agent.sex_type]
+    else:
+        eligible = copy(partnerable_agents)
 
-    if "sex" in acts_allowed:
-        eligible &= sex_partners[agent.sex_type]
+    # remove current partners bond by bond rather than building their union
+    for partners in agent.partners.values():
+        eligible.difference_update(partners)
+    eligible.discard(agent)
 
     # short circuit to avoid attempting to assort with no eligible partners
     if not eligible:
@@ -75,13 +82,16 @@ def is_assortable(agent, match_fns):
     return True
 
 
-# get the attribute as a string, recurse if nested
+# get the attribute as a string, dotted attributes are nested
 def get_str_attr(obj, attr):
-    attrs = attr.split(".")  # returns list of all attrs
-    if len(attrs) == 1:
-        return str(getattr(obj, attrs[0]))
-    else:
-        return get_str_attr(getattr(obj, attrs.pop(0)), ".".join(attrs))
+    return str(attrgetter(attr)(obj))
+
+
+# get a function which returns the attribute as a string - resolving the getter once
+# keeps per-partner checks cheap when scanning the eligible partners
+def get_str_attr_fn(attr):
+    get_attr = attrgetter(attr)
+    return lambda obj: str(get_attr(obj))
 
 
 # if this assort rule applies for this agent, get the match function for a potential partner
@@ -119,26 +129,26 @@ def get_partner_attr(assort_def):
 # given an assort def, randomly select the type the partner must have given the
 # weights and return a function to determin if a potential partner matches it
 def get_match_fn(assort_def, rand_gen):
-    partner_types = list(assort_def.partner_values.keys())
+    partner_types = set(assort_def.partner_values.keys())
     partner_type = get_partner_type(assort_def, rand_gen)
-    attr = get_partner_attr(assort_def)
+    str_attr = get_str_attr_fn(get_partner_attr(assort_def))
     if partner_type == "__other__":
         partner_types.remove("__other__")
-        return lambda ag: get_str_attr(ag, attr) not in partner_types
+        return lambda ag: str_attr(ag) not in partner_types
     else:
-        return lambda ag: get_str_attr(ag, attr) == partner_type
+        return lambda ag: str_attr(ag) == partner_type
 
 
 # given an assort def where agent_value == '__any__', return the match function
 def get_same_match_fn(assort_def, agent, rand_gen):
     partner_type = get_partner_type(assort_def, rand_gen)
-    attr = get_partner_attr(assort_def)
+    str_attr = get_str_attr_fn(get_partner_attr(assort_def))
 
-    agent_attribute = get_str_attr(agent, attr)
+    agent_attribute = str_attr(agent)
     if partner_type == "__same__":
-        return lambda ag: get_str_attr(ag, attr) == agent_attribute
+        return lambda ag: str_attr(ag) == agent_attribute
     elif partner_type == "__other__":
-        return lambda ag: get_str_attr(ag, attr) != agent_attribute
+        return lambda ag: str_attr(ag) != agent_attribute
     else:
         raise ValueError(
             "When using same-assorting, only valid partner_types are __same__ and __other__"
@@ -148,41 +158,39 @@ def get_same_match_fn(assort_def, agent, rand_gen):
 # given an assort def where partner_attribute == 'location', return the match function
 def get_location_match_fn(assort_def, agent, rand_gen):
     partner_type = get_partner_type(assort_def, rand_gen)
-    attr = "location"
+    str_attr = get_str_attr_fn("location")
 
-    agent_location = get_str_attr(agent, attr)
+    agent_location = str_attr(agent)
     agent_neighbors = agent.location.neighbors
     if assort_def.agent_value == "__any__":
         if partner_type == "__same__":
-            return lambda ag: get_str_attr(ag, attr) == agent_location
+            return lambda ag: str_attr(ag) == agent_location
         elif partner_type == "__other__":
             if "__neighbor__" in assort_def.partner_values:
-                return lambda ag: get_str_attr(ag, attr) not in agent_neighbors.union(
-                    [agent_location]
-                )
+                excluded = agent_neighbors.union([agent_location])
+                return lambda ag: str_attr(ag) not in excluded
             else:
-                return lambda ag: get_str_attr(ag, attr) != agent_location
+                return lambda ag: str_attr(ag) != agent_location
         elif partner_type == "__neighbor__":
-            return lambda ag: get_str_attr(ag, attr) in agent_neighbors
+            return lambda ag: str_attr(ag) in agent_neighbors
         else:
             raise ValueError(
                 "When using same-assorting on location, only valid partner_types are __same__, __neighbor__ and __other__"
             )
     else:
-        partner_types = list(assort_def.partner_values.keys())
+        partner_types = set(assort_def.partner_values.keys())
         if partner_type == "__other__":
             partner_types.remove("__other__")
             if "__neighbor__" in assort_def.partner_values:
                 partner_types.remove("__neighbor__")
-                return lambda ag: get_str_attr(ag, attr) not in agent_neighbors.union(
-                    partner_types
-                )
+                excluded = agent_neighbors.union(partner_types)
+                return lambda ag: str_attr(ag) not in excluded
             else:
-                return lambda ag: get_str_attr(ag, attr) not in partner_types
+                return lambda ag: str_attr(ag) not in partner_types
         elif partner_type == "__neighbor__":
-            return lambda ag: get_str_attr(ag, attr) in agent_neighbors
+            return lambda ag: str_attr(ag) in agent_neighbors
         else:
-            return lambda ag: get_str_attr(ag, attr) == partner_type
+            return lambda ag: str_attr(ag) == partner_type
 
 
 @utils.memo
@@ -261,13 +269,14 @@ def get_partnership_duration(
         number of time steps the partnership should endure
     """
 
-    if params.partnership.duration[bond_type][race].type == "bins":
-        dur_info = params.partnership.duration[bond_type][race].bins
+    dur_params = params.partnership.duration[bond_type][race]
+    if dur_params.type == "bins":
+        dur_info = dur_params.bins
         i = utils.get_independent_bin(rand_gen, dur_info)
-        duration = utils.safe_random_int(dur_info[i].min, dur_info[i].max, rand_gen)
+        dur_bin = dur_info[i]
+        duration = utils.safe_random_int(dur_bin.min, dur_bin.max, rand_gen)
 
     else:
-        dist = params.partnership.duration[bond_type][race].distribution
-        duration = int(utils.safe_dist(dist, rand_gen))
+        duration = int(utils.safe_dist(dur_params.distribution, rand_gen))
 
     return duration
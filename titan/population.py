@@ -84,6 +84,9 @@ class Population:
         # pwid agents (performance for partnering)
         self.pwid_agents = ag.AgentSet("PWID", parent=self.all_agents)
 
+        # number of agents of each race (performance for prep targets)
+        self.race_counts: Dict[str, int] = {race: 0 for race in params.classes.races}
+
         # agents who can take on a partner
         self.partnerable_agents: Dict[str, Set["ag.Agent"]] = {}
         for bond_type in self.params.classes.bond_types.keys():
@@ -91,11 +94,16 @@ class Population:
 
         # who can sleep with whom
         self.sex_partners: Dict[str, Set["ag.Agent"]] = {}
-        for sex_type in self.params.classes.sex_types.keys():
+        self.sleeps_with: Dict[str, Tuple[str, ...]] = {}
+        for sex_type, sex_type_def in self.params.classes.sex_types.items():
             self.sex_partners[sex_type] = set()
+            self.sleeps_with[sex_type] = tuple(sex_type_def.sleeps_with)
 
         self.relationships: Set["ag.Relationship"] = set()
 
+        # graph edges waiting to be added in bulk (while creating relationships)
+        self.pending_edges: Optional[List] = None
+
         # find average partnership durations
         self.mean_rel_duration: Dict[str, Dict] = partnering.get_mean_rel_duration(
             self.params
@@ -104,6 +112,7 @@ class Population:
         logging.info("  Creating agents")
         # for each location in the population, create agents per that location's demographics
         init_time = -1 * self.params.model.time.burn_steps
+        new_agents = []
         for loc in self.geography.locations.values():
             for race in params.classes.races:
                 for i in range(
@@ -119,11 +128,16 @@ class Population:
                         )
                         break
                     agent = self.create_agent(loc, race, init_time)
-                    self.add_agent(agent)
+                    self.add_agent(agent, add_to_graph=False)
+                    new_agents.append(agent)
+
+        # add the nodes in one batch, in creation order
+        if self.enable_graph:
+            self.graph.add_nodes_from(new_agents)
 
         # initialize relationships
         logging.info("  Creating Relationships")
-        self.update_partner_assignments(0)
+        self.update_partner_assignments(0, batch_edges=True)
 
     def create_agent(
         self,
@@ -182,11 +196,8 @@ class Population:
         else:
             agent.sex_role = sex_role
 
-        agent_params = (
-            agent.location.params.demographics[race]
-            .sex_type[sex_type]
-            .drug_type[drug_type]
-        )
+        agent_params = loc.drug_type_params[race, sex_type, drug_type]
+        partner_scale = loc.params.calibration.sex.partner
 
         for exposure in self.exposures:
             agent_feature = getattr(agent, exposure.name)
@@ -197,10 +208,7 @@ class Population:
             dist_info = agent_params.num_partners[bond]
             agent.mean_num_partners[bond] = ceil(
                 utils.safe_dist(dist_info, self.np_random)
-                * utils.safe_divide(
-                    agent.location.params.calibration.sex.partner,
-                    self.mean_rel_duration[bond][race],
-                )
+                * utils.safe_divide(partner_scale, self.mean_rel_duration[bond][race])
             )
             # so not zero if added mid-year
             agent.target_partners[bond] = agent.mean_num_partners[bond]
@@ -216,24 +224,26 @@ class Population:
 
         return agent
 
-    def add_agent(self, agent: "ag.Agent"):
+    def add_agent(self, agent: "ag.Agent", add_to_graph: bool = True):
         """
         Adds an agent to the population
 
         args:
             agent : The agent to be added
+            add_to_graph : whether to add the agent to the graph (if enabled), set to `False` when the caller adds nodes in bulk
         """
         # Add to all agent set
         self.all_agents.add_agent(agent)
+        self.race_counts[agent.race] += 1
 
         if agent.drug_type == "Inj":
             self.pwid_agents.add_agent(agent)
 
         # who can sleep with this agent
-        for sex_type in self.params.classes.sex_types[agent.sex_type].sleeps_with:
+        for sex_type in self.sleeps_with[agent.sex_type]:
             self.sex_partners[sex_type].add(agent)
 
-        if self.enable_graph:
+        if self.enable_graph and add_to_graph:
             self.graph.add_node(agent)
 
     def add_relationship(self, rel: "ag.Relationship"):
@@ -246,20 +256,33 @@ class Population:
         self.relationships.add(rel)
 
         if self.enable_graph:
-            self.graph.add_edge(rel.agent1, rel.agent2, type=rel.bond_type)
+            if self.pending_edges is None:
+                self.graph.add_edge(rel.agent1, rel.agent2, type=rel.bond_type)
+            else:
+                self.pending_edges.append(
+                    (rel.agent1, rel.agent2, {"type": rel.bond_type})
+                )
 
     def remove_agent(self, agent: "ag.Agent"):
         """
-        Remove an agent from the population.
+        Remove an agent from the population, ending any relationships they are in.
 
         args:
             agent : Agent to remove
         """
+        # the agent's edges are dropped along with its node below, so only the
+        # relationship bookkeeping is done per relationship
+        for rel in copy(agent.relationships):
+            rel.progress(force=True)
+            self.relationships.remove(rel)
+            self.update_partnerability(rel.get_partner(agent))
+
         self.all_agents.remove_agent(agent)
+        self.race_counts[agent.race] -= 1
 
-        for partner_type in self.sex_partners:
-            if agent in self.sex_partners[partner_type]:
-                self.sex_partners[partner_type].remove(agent)
+        # the agent was only added to the sets of the sex types it sleeps with
+        for sex_type in self.sleeps_with[agent.sex_type]:
+            self.sex_partners[sex_type].discard(agent)
 
         for exposure in self.exposures:
             agent_attr = getattr(agent, exposure.name)
@@ -275,8 +298,7 @@ class Population:
             self.graph.remove_node(agent)
 
         for bond in self.partnerable_agents.values():
-            if agent in bond:
-                bond.remove(agent)
+            bond.discard(agent)
 
     def remove_relationship(self, rel: "ag.Relationship"):
         """
@@ -304,13 +326,20 @@ class Population:
         returns:
             age and the bin the age came from
         """
-        bins = loc.params.demographics[race].age
-        i = utils.get_independent_bin(self.pop_random, bins)
-        age = self.pop_random.randrange(bins[i].min, bins[i].max)
+        # independent bins: first bin whose prob is at least rand_val, else the last
+        rand_val = self.pop_random.random()
+        for i, prob, min_age, max_age in loc.age_bins[race]:
+            if rand_val <= prob:
+                break
+
+        age = self.pop_random.randrange(min_age, max_age)
         return age, i
 
     def update_agent_partners(
-        self, agent: "ag.Agent", bond_type: str, components: List
+        self,
+        agent: "ag.Agent",
+        bond_type: str,
+        components: Dict["ag.Agent", Set["ag.Agent"]],
     ) -> bool:
         """
         Finds and bonds new partner. Creates relationship object for partnership,
@@ -320,6 +349,7 @@ class Population:
         args:
             agent: Agent that is seeking a new partner
             bond_type: What type of bond the agent is seeking to make
+            components: mapping from each agent in the network to the agents in its component
 
         returns:
             True if no match was found for agent (used for retries)
@@ -331,12 +361,7 @@ class Population:
             and agent.has_partners()
         ):
             # find agent's component
-            agent_component: Set["ag.Agent"] = set()
-            for comp in components:
-                if agent in comp:
-                    agent_component = comp
-                    break
-
+            agent_component = components.get(agent, set())
             partnerable_agents = partnerable_agents & agent_component
 
         partner = partnering.select_partner(
@@ -368,22 +393,29 @@ class Population:
             no_match = False
         return no_match
 
-    def update_partner_assignments(self, t: int):
+    def update_partner_assignments(self, t: int, batch_edges: bool = False):
         """
         Determines which agents will seek new partners from All_agentSet.
             Calls update_agent_partners for any agents that desire partners.
 
         args:
             t: current time step of the model
+            batch_edges: whether to add the new relationships to the graph in one batch once partnering is done (used when creating the population)
         """
         # update agent targets annually
         if t % self.params.model.time.steps_per_year == 0:
             self.update_partner_targets()
 
+        # index each agent's component once for same component partnering
+        network_components: Dict["ag.Agent", Set["ag.Agent"]] = {}
         if self.enable_graph:
-            network_components = [set(g.nodes()) for g in self.components]
-        else:
-            network_components = []
+            for g in self.components:
+                comp = set(g.nodes())
+                network_components.update(dict.fromkeys(comp, comp))
+            if batch_edges:
+                self.pending_edges = []
+
+        break_point = self.params.calibration.partnership.break_point
 
         # Now create partnerships until available partnerships are out
         for bond in self.params.classes.bond_types:
@@ -407,12 +439,14 @@ class Population:
                     # add agent back to eligible pool
                     if (
                         len(agent.partners[bond]) < agent.target_partners[bond]
-                        and attempts[agent]
-                        < self.params.calibration.partnership.break_point
+                        and attempts[agent] < break_point
                     ):
                         eligible_agents.append(agent)
 
         if self.enable_graph:
+            if self.pending_edges is not None:
+                self.graph.add_edges_from(self.pending_edges)
+                self.pending_edges = None
             self.trim_graph()
 
         self.update_agent_components()
@@ -421,27 +455,31 @@ class Population:
         """
         Update the target number of partners for each agent and bond type
         """
-        for a in self.all_agents:
-            for bond in self.params.classes.bond_types:
-                a.target_partners[bond] = utils.poisson(
-                    a.mean_num_partners[bond], self.np_random
-                )
+        bonds = list(self.params.classes.bond_types)
+        agents = list(self.all_agents)
+
+        # draw all targets at once (same order as drawing per agent, per bond)
+        targets = self.np_random.poisson(
+            [[a.mean_num_partners[bond] for bond in bonds] for a in agents]
+        )
+        for a, agent_targets in zip(agents, targets):
+            for bond, target in zip(bonds, agent_targets):
+                a.target_partners[bond] = int(target)
             self.update_partnerability(a)
 
     def update_partnerability(self, a):
         """
         Update whether each agent in the population is currently able to form new relationships for each bond type
         """
-        for bond in self.params.classes.bond_types.keys():
-            if a in self.partnerable_agents[bond]:
-                if len(a.partners[bond]) > (
-                    a.target_partners[bond] * self.params.calibration.partnership.buffer
-                ):
-                    self.partnerable_agents[bond].remove(a)
-            elif len(a.partners[bond]) < (
-                a.target_partners[bond] * self.params.calibration.partnership.buffer
-            ):
-                self.partnerable_agents[bond].add(a)
+        buffer = self.params.calibration.partnership.buffer
+        for bond, partnerable in self.partnerable_agents.items():
+            num_partners = len(a.partners[bond])
+            buffered_target = a.target_partners[bond] * buffer
+            if a in partnerable:
+                if num_partners > buffered_target:
+                    partnerable.remove(a)
+            elif num_partners < buffered_target:
+                partnerable.add(a)
 
     def update_agent_components(self):
         """
@@ -465,25 +503,26 @@ class Population:
         if self.params.model.network.type == "comp_size":
 
             def trim_component(component, max_size):
-                for agent in component.nodes:
-                    if (
-                        self.pop_random.random()
-                        < self.params.calibration.network.trim.prob
-                    ):
-                        for rel in copy(agent.relationships):
-                            if len(agent.relationships) == 1:
-                                break  # Make sure that agents stay part of the
-                                # network by keeping one bond
-                            rel.progress(force=True)
-                            self.remove_relationship(rel)
-
-                # recurse on new sub-components
-                sub_comps = utils.connected_components(component)
-                for sub_comp in sub_comps:
-                    if sub_comp.number_of_nodes() > max_size:
-                        trim_component(component, max_size)
-                    else:
-                        break
+                trim_prob = self.params.calibration.network.trim.prob
+                # trim the component, then any of its sub-components that are still too big
+                to_trim = [component]
+                while to_trim:
+                    comp = to_trim.pop()
+                    for agent in comp.nodes:
+                        if self.pop_random.random() < trim_prob:
+                            for rel in copy(agent.relationships):
+                                if len(agent.relationships) == 1:
+                                    break  # Make sure that agents stay part of the
+                                    # network by keeping one bond
+                                rel.progress(force=True)
+                                self.remove_relationship(rel)
+
+                    # sub-components are sorted largest first
+                    for sub_comp in utils.connected_components(comp):
+                        if sub_comp.number_of_nodes() > max_size:
+                            to_trim.append(sub_comp)
+                        else:
+                            break
 
             components = self.connected_components()
             for comp in components:
@@ -521,7 +560,7 @@ class Population:
                 new_loc = utils.safe_random_choice(
                     m_param["values"],
                     self.pop_random,
-                    weights=m_param["weights"],
+                    cum_weights=m_param["cum_weights"],
                 )
                 if m_attr == "name":
                     a.location = self.geography.locations[new_loc]
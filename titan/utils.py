@@ -1,5 +1,5 @@
 import random
-from functools import wraps
+from functools import lru_cache
 from typing import TypeVar, Collection, Union, Iterable, Dict, Tuple, Set
 from math import floor
 import logging
@@ -20,15 +20,8 @@ def memo(f):
     Decorator to memoize a function
     (caches results given args, only use if deterministic)
     """
-    cache = {}
-
-    @wraps(f)
-    def wrap(*arg):
-        if arg not in cache:
-            cache[arg] = f(*arg)
-        return cache[arg]
-
-    return wrap
+    # unbounded C-level cache - the argument space of memoized functions is small
+    return lru_cache(maxsize=None)(f)
 
 
 def get_check_rand_int(seed: int) -> int:
@@ -70,7 +63,7 @@ def safe_divide(numerator: int, denominator: int) -> float:
 T = TypeVar("T")
 
 
-def safe_random_choice(seq, rand_gen, weights=None):
+def safe_random_choice(seq, rand_gen, weights=None, cum_weights=None):
     """
     Return None or a random choice from a collection of items
 
@@ -78,6 +71,7 @@ def safe_random_choice(seq, rand_gen, weights=None):
         seq: collection to select a random item from
         rand_gen: random number generator
         weights: an optional collection of weights to use instead of a uniform distribution
+        cum_weights: an optional collection of cumulative weights, used instead of `weights` to avoid re-accumulating them on every call
 
     returns:
         an item, or `None` if the collection is empty
@@ -91,10 +85,10 @@ def safe_random_choice(seq, rand_gen, weights=None):
     # don't call out to random choices if we don't need to (for performance)
     if len(seq) == 1:
         return seq[0]
-    elif len(seq) == 2 and weights is None:
+    elif len(seq) == 2 and weights is None and cum_weights is None:
         return seq[0] if rand_gen.random() <= 0.5 else seq[1]
 
-    choices = rand_gen.choices(seq, weights=weights)
+    choices = rand_gen.choices(seq, weights=weights, cum_weights=cum_weights)
     return choices[0]
 
 
@@ -115,17 +109,17 @@ def safe_random_int(start: int, stop: int, rand_gen) -> int:
 
 def safe_shuffle(seq: Collection[T], rand_gen) -> Iterable[T]:
     """
-    Return None or a shuffled sequence
+    Return an empty list or a shuffled sequence
 
     args:
-        seq: collection to shuffle
+        seq: collection to shuffle (sets are copied to a list, lists are shuffled in place)
         rand_gen: random number generator
 
     returns:
-        shuffled sequence, or `None` if empty
+        shuffled sequence, or `[]` if empty
     """
     if seq:
-        if isinstance(seq, set):
+        if isinstance(seq, (set, frozenset)):
             seq = list(seq)
         rand_gen.shuffle(seq)
         return seq
@@ -249,7 +243,8 @@ def total_probability(p: float, num_acts: int) -> float:
     if num_acts == 1:
         return p
     elif num_acts >= 1:
-        return 1.0 - binom_0(num_acts, p)
+        # binom_0 inlined - a float pow is cheaper than the extra call
+        return 1.0 - (1.0 - p) ** num_acts
     else:
         return 0.0
 
@@ -264,11 +259,11 @@ def connected_components(graph):
     returns:
         list of connected components
     """
-    return sorted(
-        list(graph.subgraph(c) for c in nx.connected_components(graph)),
-        key=len,
-        reverse=True,
-    )
+    # sort the node sets (constant time len) before wrapping them in subgraph views
+    return [
+        graph.subgraph(c)
+        for c in sorted(nx.connected_components(graph), key=len, reverse=True)
+    ]
 
 
 def get_independent_bin(rand_gen, bin_def: ObjMap) -> int: